@@ -3,7 +3,22 @@
 # Optional: set WRITE_FILE_PATH to also write a .bndl file to disk.
 
 import bpy, re
-from collections import defaultdict
+import io
+from collections import defaultdict, deque
+from functools import lru_cache
+
+# Sequence-like value types we serialize as <a, b, c>; checked with isinstance
+# instead of a try/list(v) probe so non-sequences (the common case) don't pay
+# for a raised-and-swallowed TypeError. Besides mathutils wrappers, Blender
+# hands us raw RNA arrays (e.g. RGBA socket defaults) and IDPropertyArray for
+# modifier values read via mod[key].
+try:
+    from mathutils import Vector, Color, Euler, Quaternion
+    from idprop.types import IDPropertyArray
+    _SEQLIKE = (list, tuple, Vector, Color, Euler, Quaternion,
+                bpy.types.bpy_prop_array, IDPropertyArray)
+except Exception:
+    _SEQLIKE = (list, tuple)
 
 # ============= CONFIG =============
 WRITE_FILE_PATH = ""  # e.g. r"H:\Exports\my_tree.bndl" or "" to skip writing
@@ -16,11 +31,28 @@ BNDL_VERSION = "1.2"
 # --- SetUser emission helpers (compare modifier overrides vs. GI defaults) ---
 import math
 
+# Hot-loop regex, compiled once (the re module cache still costs a hash+lookup per call)
+_RE_KV = re.compile(r"^§\s+(.*?)\s+§\s+to\s+(.+)$")
+
 def _ser_num(x):
-    txt = f"{float(x):.9f}".rstrip("0").rstrip(".")
+    # repr() of a float is already the shortest round-trip form, produced in one
+    # pass — no rstrip passes. Fall back to the 9-decimal trim only when repr
+    # goes scientific (we never emit exponents).
+    txt = repr(float(x))
+    if "e" in txt:
+        txt = f"{float(x):.9f}".rstrip("0").rstrip(".")
+    elif txt.endswith(".0"):
+        txt = txt[:-2]
     if txt == "-0": txt = "0"
     return txt
 
+@lru_cache(maxsize=4096)
+def _fmt_float_tuple(t):
+    """Format a float tuple as <a, b, c>; cached because vectors repeat heavily
+    across sockets ((0,0,0), unit axes, default colors...)."""
+    return "<" + ", ".join(_ser_num(x) for x in t) + ">"
+
+# Datablock sentinels (match your v1.2 spec); keyed by RNA type name for O(1) dispatch
 _DB_SENTINELS = {
     "Material": ("❆", "❆"),
     "Object": ("⊞", "⊞"),
@@ -33,21 +65,14 @@ _DB_SENTINELS = {
 def _serialize_user_value(v):
     """Serialize a modifier-side value using the same visual rules as defaults."""
     # datablocks
-    try:
-        tname = type(v).__name__
-        if tname in _DB_SENTINELS and hasattr(v, "name"):
-            l, r = _DB_SENTINELS[tname]
-            nm = v.name.replace(l, l + l)
-            return f"{l}{nm}{r}"
-    except Exception:
-        pass
+    db = _serialize_datablock(v)
+    if db is not None:
+        return db
     # sequences (float/int)
-    try:
+    if isinstance(v, _SEQLIKE):
         it = list(v)
         if all(isinstance(a, (int, float)) for a in it):
-            return f"<{', '.join(_ser_num(a) for a in it)}>"
-    except Exception:
-        pass
+            return _fmt_float_tuple(tuple(map(float, it)))
     # bool
     if isinstance(v, bool):
         return "<True>" if v else "<False>"
@@ -59,49 +84,55 @@ def _serialize_user_value(v):
         return f"©{v}©"
     return None
 
-def _nearly_equal_nums(a, b, eps=1e-6):
-    try:
-        return abs(float(a) - float(b)) <= eps
-    except Exception:
-        return False
-
-def _nearly_equal(a, b, eps=1e-6):
-    try:
-        la, lb = list(a), list(b)
-        if len(la) == len(lb) and all(isinstance(x, (int,float)) for x in la+lb):
-            return all(_nearly_equal_nums(x, y, eps) for x, y in zip(la, lb))
-    except Exception:
-        pass
-    if isinstance(a, (int,float)) and isinstance(b, (int,float)):
-        return _nearly_equal_nums(a, b, eps)
-    return a == b
-
-def _parse_gi_defaults_from_text(text):
-    """Return ordered list of (display_name_with_optional_ordinal, serialized_value) for GI defaults."""
+@lru_cache(maxsize=8)
+def _parse_existing_bndl(text):
+    """One-pass parse of the GI defaults already emitted into a BNDL buffer.
+    Returns (rows, gi_map, found): rows is the ordered
+    (display_name_with_optional_ordinal, serialized_value) list, gi_map the
+    same data as a dict. Cached so the ordered and mapped consumers share a
+    single scan of the (immutable within a run) export text."""
     rows = []
+    found = False
     lines = text.splitlines()
     i, n = 0, len(lines)
     while i < n:
-        ln = lines[i].rstrip()
-        if ln.startswith("Set  [ Group Input #"):
+        if lines[i].startswith("Set  [ Group Input #"):
+            found = True
             i += 1
             while i < n:
-                kv = lines[i].rstrip()
+                kv = lines[i]
                 if not kv.startswith("§ "):
                     break
-                m = re.match(r"^§\s+(.*?)\s+§\s+to\s+(.+)$", kv)
+                m = _RE_KV.match(kv.rstrip())
                 if m:
                     rows.append((m.group(1), m.group(2)))
                 i += 1
             continue
         i += 1
-    return rows
+    return tuple(rows), dict(rows), found
 
-def _iter_interface_input_items(ng):
-    """Yield (index0, display_name, item) for INPUT interface sockets in order (Blender 4.x)."""
-    iface = ng.interface
+def _parse_gi_defaults_from_text(text):
+    """Return ordered list of (display_name_with_optional_ordinal, serialized_value) for GI defaults."""
+    return list(_parse_existing_bndl(text)[0])
+
+# Per-tree cache of filtered INPUT interface sockets. items_tree is an RNA
+# collection that re-evaluates per iteration; walk it once per tree, not once
+# per consumer. The cache lives for one script run (the file is re-executed on
+# every export), so it never goes stale against interface edits.
+_IFACE_INPUT_CACHE = {}
+
+def _interface_input_items(ng):
+    """Return [(index0, display_name, item)] for INPUT interface sockets in order (Blender 4.x)."""
+    try:
+        key = ng.as_pointer()
+    except Exception:
+        key = id(ng)
+    rows = _IFACE_INPUT_CACHE.get(key)
+    if rows is not None:
+        return rows
+    rows = []
     idx = 0
-    for it in getattr(iface, "items_tree", []):
+    for it in getattr(ng.interface, "items_tree", []):
         try:
             if getattr(it, "item_type", None) != 'SOCKET':
                 continue
@@ -110,45 +141,131 @@ def _iter_interface_input_items(ng):
             disp = (getattr(it, "name", "") or "").strip()
             if not disp:
                 disp = "input"
-            yield idx, disp, it
+            rows.append((idx, disp, it))
             idx += 1
         except Exception:
             continue
+    _IFACE_INPUT_CACHE[key] = rows
+    return rows
 
-def _read_mod_input_value(mod, it, idx0):
-    """Try multiple keys to read the GN modifier's value for this interface item."""
+def _iter_interface_input_items(ng):
+    """Yield (index0, display_name, item) for INPUT interface sockets in order (Blender 4.x)."""
+    yield from _interface_input_items(ng)
+
+_MISSING = object()
+
+# Descriptions use ~…~ delimiters, so embedded tildes become dashes.
+_TILDE_TABLE = str.maketrans({"~": "-"})
+
+# Optional interface-item attributes emitted as "<name>::<label>" meta rows, in
+# output order. mode: "quote" → repr()'d, "bool" → coerced flag, None → raw.
+_META_SPEC = (
+    ("structure_type", "Structure Type", "quote"),
+    ("subtype", "Subtype", "quote"),
+    ("min_value", "Min", None),
+    ("max_value", "Max", None),
+    ("hide_value", "Hide Value", "bool"),
+    ("hide_in_modifier", "Hide in Modifier", "bool"),
+    ("default_attribute", "Default Attribute", "quote"),
+)
+# Group Output sockets carry no limits/defaults; only these rows apply.
+_META_SPEC_GO = tuple(
+    row for row in _META_SPEC
+    if row[0] in ("structure_type", "subtype", "hide_in_modifier")
+)
+# The NodeGroupInput Set-loop special case writes the same attributes as plain
+# KV rows with its own ordering, value formats and truthiness gates.
+_META_SPEC_KV = (
+    ("default_attribute", "Default Attribute", "str", True),
+    ("subtype", "Subtype", "str", True),
+    ("min_value", "Min", "angle", False),
+    ("max_value", "Max", "angle", False),
+    ("hide_value", "Hide Value", "flag", True),
+    ("hide_in_modifier", "Hide in Modifier", "flag", True),
+    ("structure_type", "Structure Type", "str", True),
+    ("socket_type", "Socket Type", "str", True),
+)
+
+class _DVShim:
+    """Minimal stand-in exposing .default_value so interface items can go
+    through the socket serializer."""
+    __slots__ = ("default_value",)
+    def __init__(self, dv):
+        self.default_value = dv
+
+def _ser_vec_default(v):
+    seq = list(v)
+    if len(seq) in (3, 4):
+        return "<" + ", ".join(str(float(x)) for x in seq) + ">"
+    return None
+
+# Per-type fast paths for interface default values, mirroring the primitive
+# branches of serialize_default(); types not listed (datablocks, prop arrays)
+# still take the shim + full cascade.
+_SERIALIZE_BY_TYPE = {
+    bool: lambda v: "<True>" if v else "<False>",
+    int: lambda v: f"<{v}>",
+    float: lambda v: f"<{v}>",
+    str: lambda v: f"©{v}©",
+}
+try:
+    _SERIALIZE_BY_TYPE[Vector] = _ser_vec_default
+    _SERIALIZE_BY_TYPE[Color] = _ser_vec_default
+except NameError:
+    pass
+
+def _emit_meta(meta_lines, disp, suffix, val, quote=False):
+    """Append one '§ name::suffix § to value' meta row; None is skipped."""
+    if val is None:
+        return
+    if quote:
+        meta_lines.append(f"§ {disp}::{suffix} § to {repr(val)}")
+    elif isinstance(val, bool):
+        meta_lines.append(f"§ {disp}::{suffix} § to " + ("<True>" if val else "<False>"))
+    elif isinstance(val, (int, float)):
+        meta_lines.append(f"§ {disp}::{suffix} § to <{val}>")
+    else:
+        meta_lines.append(f"§ {disp}::{suffix} § to {val}")
+
+def _read_mod_input_value(mod, it, idx0, known_keys):
+    """Try multiple keys to read the GN modifier's value for this interface item.
+    known_keys is the modifier's ID-property key set, computed once by the caller
+    so each probe is a set lookup instead of a `key in mod` RNA call."""
     ident = getattr(it, "identifier", None) or getattr(it, "name", None)
-    # mapping-like access
-    try:
-        if ident and ident in mod:
-            return mod[ident]
-    except Exception:
-        pass
-    # attribute
-    try:
-        if ident and hasattr(mod, ident):
-            return getattr(mod, ident)
-    except Exception:
-        pass
+    if ident:
+        # mapping-like access
+        if ident in known_keys:
+            try:
+                return mod[ident]
+            except Exception:
+                pass
+        # attribute
+        val = getattr(mod, ident, _MISSING)
+        if val is not _MISSING:
+            return val
     # common index-based fallbacks
     for key in (f"Input_{idx0+1}", f"Socket_{idx0+1}"):
-        try:
-            if key in mod:
+        if key in known_keys:
+            try:
                 return mod[key]
-        except Exception:
-            pass
+            except Exception:
+                pass
     return None
 
-def _emit_setuser_block(ng, mod, existing_text):
-    """Compare modifier values to GI defaults; emit SetUser block if any differ."""
+def _emit_setuser_block(ng, mod, existing_text, out):
+    """Compare modifier values to GI defaults; append a SetUser block to out if any differ."""
     if ng is None or mod is None:
-        return ""
+        return
     # 1) Gather the GI defaults already emitted (so names/ordinals match)
     gi_rows = _parse_gi_defaults_from_text(existing_text)
     if not gi_rows:
-        return ""
+        return
 
     # 2) Build base-name → [(idx0, item)] map from the interface
+    try:
+        known_keys = set(mod.keys())
+    except Exception:
+        known_keys = set()
     base_map = {}
     for idx0, disp, it in _iter_interface_input_items(ng):
         base_map.setdefault(disp, []).append((idx0, it))
@@ -156,14 +273,18 @@ def _emit_setuser_block(ng, mod, existing_text):
     # 3) Walk defaults in the same order and probe the modifier for overrides
     overrides = []
     for disp_with_ord, def_ser in gi_rows:
-        m = re.match(r"^(.*?)(?:\[(\d+)\])?$", disp_with_ord)
-        base = m.group(1) if m else disp_with_ord
-        want_ord = int(m.group(2)) if (m and m.group(2)) else 1
+        # Split "Name[3]" → ("Name", 3) with plain string ops; regex is overkill here
+        base, want_ord = disp_with_ord, 1
+        if disp_with_ord.endswith("]") and "[" in disp_with_ord:
+            head, _, tail = disp_with_ord.rpartition("[")
+            num = tail[:-1]
+            if num.isdigit():
+                base, want_ord = head, int(num)
         lst = base_map.get(base, [])
         if not lst or want_ord > len(lst):
             continue
         idx0, it = lst[want_ord-1]
-        user_raw = _read_mod_input_value(mod, it, idx0)
+        user_raw = _read_mod_input_value(mod, it, idx0, known_keys)
         if user_raw is None:
             continue
         user_ser = _serialize_user_value(user_raw)
@@ -183,7 +304,7 @@ def _emit_setuser_block(ng, mod, existing_text):
                 except Exception:
                     ul = [user_raw]
                 if len(nums) == len(ul):
-                    eq_val = all(_nearly_equal_nums(a, b) for a, b in zip(nums, ul))
+                    eq_val = all(_nearly_equal(a, b) for a, b in zip(nums, ul))
             except Exception:
                 eq_val = False
         if eq_val:
@@ -191,17 +312,15 @@ def _emit_setuser_block(ng, mod, existing_text):
         overrides.append((disp_with_ord, user_ser))
 
     if not overrides:
-        return ""
+        return
 
     # 4) Emit new block
-    out = []
     out.append("")
     out.append("# === USER OVERRIDES ===")
     out.append("SetUser  [ Group Input #1 ]:")
     for k, v in overrides:
         out.append(f"§ {k} § to {v}")
     out.append("")
-    return "\n".join(out)
 
 # --- User override (modifier) helpers for GI sockets ---
 
@@ -211,9 +330,7 @@ def _bndl_serialize_scalar(v):
         return f"<{v}>"
     if isinstance(v, (int, float)):
         # Avoid scientific; keep stable decimals
-        txt = f"{float(v):.9f}".rstrip("0").rstrip(".")
-        if txt == "-0": txt = "0"
-        return f"<{txt}>"
+        return f"<{_ser_num(v)}>"
     if isinstance(v, str):
         # Wrap strings with the same sentinel you already use in the spec
         return f"©{v}©"
@@ -221,45 +338,22 @@ def _bndl_serialize_scalar(v):
 
 def _bndl_serialize_seq(v):
     # tuple/list/Vector/Color → <a, b, c(, d)>
-    try:
-        it = list(v)
-    except Exception:
+    if not isinstance(v, _SEQLIKE):
         return None
-    scal = []
+    it = list(v)
+    has_bool = False
     for x in it:
         if isinstance(x, bool):
-            scal.append(f"{x}")
-        elif isinstance(x, (int, float)):
-            txt = f"{float(x):.9f}".rstrip("0").rstrip(".")
-            if txt == "-0": txt = "0"
-            scal.append(txt)
-        else:
+            has_bool = True
+        elif not isinstance(x, (int, float)):
             return None
-    return f"<{', '.join(scal)}>"
-
-# Datablock sentinels (match your v1.2 spec)
-_DB_SENTINELS = {
-    "Material": ("❆", "❆"),
-    "Object": ("⊞", "⊞"),
-    "Collection": ("✸", "✸"),
-    "Image": ("✷", "✷"),
-    "Mesh": ("⧉", "⧉"),
-    "Curve": ("𝒞", "𝒞"),
-}
+    if not has_bool:
+        return _fmt_float_tuple(tuple(map(float, it)))
+    return "<" + ", ".join(f"{x}" if isinstance(x, bool) else _ser_num(x) for x in it) + ">"
 
 def _bndl_serialize_datablock(v):
     # name only, wrapped in the correct sentinel pair; unknowns → None
-    try:
-        if v is None:
-            return None
-        id_type = type(v).__name__
-        for k, (lft, rgt) in _DB_SENTINELS.items():
-            if id_type == k:
-                nm = getattr(v, "name", "")
-                return f"{lft}{nm}{rgt}"
-    except Exception:
-        pass
-    return None
+    return _serialize_datablock(v)
 
 def _serialize_for_bndl_value(v):
     """Try datablock → sequence → scalar; return serialized string or None."""
@@ -272,11 +366,13 @@ def _serialize_for_bndl_value(v):
     return None
 
 def _nearly_equal(a, b, eps=1e-6):
+    if a is b:
+        return True
     try:
-        if isinstance(a, (list, tuple)) and isinstance(b, (list, tuple)) and len(a) == len(b):
-            return all(_nearly_equal(x, y, eps) for x, y in zip(a, b))
         if isinstance(a, (int, float)) and isinstance(b, (int, float)):
-            return abs(float(a) - float(b)) <= eps
+            return math.isclose(a, b, rel_tol=0.0, abs_tol=eps)
+        if isinstance(a, _SEQLIKE) and isinstance(b, _SEQLIKE) and len(a) == len(b):
+            return all(_nearly_equal(x, y, eps) for x, y in zip(a, b))
         return a == b
     except Exception:
         return False
@@ -284,48 +380,15 @@ def _nearly_equal(a, b, eps=1e-6):
 def _parse_defaults_from_bndl_text(text):
     """Extract the existing GI defaults block we already emitted:
        Returns (gi_block_present: bool, {display_name: serialized_value})"""
-    gi_map = {}
-    found = False
-    lines = text.splitlines()
-    i = 0
-    while i < len(lines):
-        ln = lines[i].rstrip()
-        if ln.startswith("Set  [ Group Input #"):
-            found = True
-            i += 1
-            while i < len(lines):
-                kv = lines[i].rstrip()
-                if not kv.startswith("§ "):  # end of block
-                    break
-                # § <Name> § to <value>
-                m = re.match(r"^§\s+(.*?)\s+§\s+to\s+(.+)$", kv)
-                if m:
-                    k = m.group(1)
-                    v = m.group(2)
-                    gi_map[k] = v
-                i += 1
-            continue
-        i += 1
+    _rows, gi_map, found = _parse_existing_bndl(text)
     return found, gi_map
 
 def _iter_gi_interface_inputs(ng):
-    """Yield (display_name_with_ordinal, item) for INPUT interface sockets in order."""
-    iface = ng.interface
-    # Blender 4.x: items_tree includes panels and sockets. Filter to INPUT sockets.
-    for it in getattr(iface, "items_tree", []):
-        try:
-            # Sockets have .item_type == 'SOCKET' and .in_out in {'INPUT','OUTPUT'}
-            if getattr(it, "item_type", None) != 'SOCKET':
-                continue
-            if getattr(it, "in_out", None) != 'INPUT':
-                continue
-            # Display name as shown in UI
-            disp = getattr(it, "name", "")
-            # If duplicates exist, exporter already adds [n] ordinals to display names in BNDL.
-            # We cannot know ordinals here, so we trust the defaults map to anchor names.
-            yield disp, it
-        except Exception:
-            continue
+    """Yield (display_name, item) for INPUT interface sockets in order.
+    If duplicates exist, exporter already adds [n] ordinals to display names in BNDL.
+    We cannot know ordinals here, so we trust the defaults map to anchor names."""
+    for _idx, disp, it in _interface_input_items(ng):
+        yield disp, it
 
 def _read_iface_default(it):
     """Read the interface socket default. Supports scalars/sequences/bool/enums."""
@@ -375,41 +438,62 @@ ALIASES = {
     "GeometryNodeGroup":       "Group",
 }
 
-DB_SENTINELS = {
-    "Material":   "❆",
-    "Object":     "⊞",
-    "Collection": "✸",
-    "Image":      "✷",
-    "Mesh":       "⧉",
-    "Curve":      "𝒞",
-}
-
 def _escape_with_mark(name: str, mark: str) -> str:
     """Escape any sentinel found inside a datablock name by doubling it and warn."""
-    if mark in name:
-        print(f"[BNDL] Warning: datablock name contains sentinel {mark} → escaping in output: {name!r}")
+    if mark not in name:
+        return name
+    print(f"[BNDL] Warning: datablock name contains sentinel {mark} → escaping in output: {name!r}")
     return name.replace(mark, mark + mark)
 
-def norm_type(n):
-    """Readable BNDL 'type' for a Blender node."""
-    if n.bl_idname in ALIASES:
-        return ALIASES[n.bl_idname]
+def norm_type(n, bl_id=None):
+    """Readable BNDL 'type' for a Blender node. Pass bl_id when the caller has
+    already read n.bl_idname to spare the RNA getattr."""
+    if bl_id is None:
+        bl_id = n.bl_idname
+    if bl_id in ALIASES:
+        return ALIASES[bl_id]
     label = (getattr(n, "bl_label", "") or "").strip()
     if label:
         return label
-    return (n.bl_idname
+    return (bl_id
             .replace("GeometryNode","")
             .replace("FunctionNode","")
             .replace("ShaderNode",""))
 
+_REROUTE_IDS = {"NodeReroute", "GeometryNodeReroute"}
+
+# Zone endpoints → bucket index used by _emit_zone_pairs
+# (sim in, sim out, repeat in, repeat out)
+_ZONE_BUCKETS = {
+    "GeometryNodeSimulationInput": 0,
+    "GeometryNodeSimulationOutput": 1,
+    "GeometryNodeRepeatInput": 2,
+    "GeometryNodeRepeatOutput": 3,
+}
+
 def is_reroute(n):
-    return n.bl_idname in {"NodeReroute", "GeometryNodeReroute"}
+    return n.bl_idname in _REROUTE_IDS
 
 def is_frame(n):
     return n.bl_idname == "NodeFrame"
 
-def _enum_label_safe(prop, enum_identifier):
+# Static enum label tables keyed by (bl_idname, prop_id); enum_items never
+# changes for a given node type, so resolve identifier→name once per type.
+_ENUM_LABEL_CACHE = {}
+
+def _enum_label_safe(prop, enum_identifier, cache_key=None):
     """Return UI label for enum identifier, safely across 4.x."""
+    if cache_key is not None:
+        table = _ENUM_LABEL_CACHE.get(cache_key)
+        if table is None:
+            table = {}
+            try:
+                for it in prop.enum_items:
+                    table[it.identifier] = it.name
+            except Exception:
+                pass
+            _ENUM_LABEL_CACHE[cache_key] = table
+        return table.get(enum_identifier, "")
     try:
         item = prop.enum_items[enum_identifier]
         return item.name
@@ -425,14 +509,17 @@ def _enum_label_safe(prop, enum_identifier):
 
 def ui_enum_label(n, prop_id):
     try:
-        prop = n.bl_rna.properties[prop_id]
         ident = getattr(n, prop_id)
-        return _enum_label_safe(prop, ident)
+        cache_key = (n.bl_idname, prop_id)
+        prop = None
+        if cache_key not in _ENUM_LABEL_CACHE:
+            prop = n.bl_rna.properties[prop_id]
+        return _enum_label_safe(prop, ident, cache_key)
     except Exception:
         return ""
 
-def node_variant_label(n):
-    t = n.bl_idname
+def node_variant_label(n, bl_id=None):
+    t = bl_id if bl_id is not None else n.bl_idname
     if t in {"FunctionNodeMath", "ShaderNodeMath",
              "FunctionNodeVectorMath", "ShaderNodeVectorMath",
              "FunctionNodeBooleanMath", "ShaderNodeBooleanMath",
@@ -442,30 +529,19 @@ def node_variant_label(n):
         return ui_enum_label(n, "data_type")
     return ""
 
-def _incoming_link_for(sock):
-    nt = sock.node.id_data
-    for ln in nt.links:
-        if ln.to_socket == sock:
-            return ln
-    return None
+def _build_link_maps(ng):
+    """Index ng.links once by socket RNA pointer: (to_socket → link, from_socket → [links]).
+    Avoids rescanning the whole link collection per reroute hop."""
+    by_to = {}
+    by_from = defaultdict(list)
+    for ln in ng.links:
+        try:
+            by_to[ln.to_socket.as_pointer()] = ln
+            by_from[ln.from_socket.as_pointer()].append(ln)
+        except Exception:
+            continue
+    return by_to, by_from
 
-def resolve_source_socket(from_sock):
-    s = from_sock
-    while is_reroute(s.node):
-        ln = _incoming_link_for(s.node.inputs[0])
-        if not ln:
-            break
-        s = ln.from_socket
-    return s
-
-def resolve_dest_socket(to_sock):
-    s = to_sock
-    while is_reroute(s.node):
-        outs = [ln for ln in s.node.id_data.links if ln.from_socket == s.node.outputs[0]]
-        if not outs:
-            break
-        s = outs[0].to_socket
-    return s
 
 def socket_position(sock):
     """Return zero-based position of this socket within its node's inputs/outputs (4.x: no .index).
@@ -489,42 +565,13 @@ def socket_position(sock):
             return i
     return -1
 
-def iter_links_collapsed(ng):
-    """Yield (from_socket, to_socket) between non-reroute/frame nodes, collapsing reroutes."""
-    seen = set()
-    for ln in ng.links:
-        dst = resolve_dest_socket(ln.to_socket)
-        src = resolve_source_socket(ln.from_socket)
-        if is_reroute(src.node) or is_reroute(dst.node) or is_frame(src.node) or is_frame(dst.node):
-            continue
-        # Use socket RNA pointers for dedupe; this distinguishes multiple links into a multi-input
-        try:
-            key = (src.as_pointer(), dst.as_pointer())
-        except Exception:
-            # Fallback to node pointers + computed positions
-            src_i = socket_position(src)
-            dst_i = socket_position(dst)
-            key = (src.node.as_pointer(), src_i, dst.node.as_pointer(), dst_i)
-        if key in seen:
-            continue
-        seen.add(key)
-        yield (src, dst)
-
-
 def _serialize_datablock(v):
+    """Sentinel-wrap a datablock name via one type-name lookup (no isinstance cascade)."""
     try:
-        if isinstance(v, bpy.types.Material):
-            m = DB_SENTINELS["Material"];   return f"{m}{_escape_with_mark(v.name, m)}{m}"
-        if isinstance(v, bpy.types.Object):
-            m = DB_SENTINELS["Object"];     return f"{m}{_escape_with_mark(v.name, m)}{m}"
-        if isinstance(v, bpy.types.Collection):
-            m = DB_SENTINELS["Collection"]; return f"{m}{_escape_with_mark(v.name, m)}{m}"
-        if isinstance(v, bpy.types.Image):
-            m = DB_SENTINELS["Image"];      return f"{m}{_escape_with_mark(v.name, m)}{m}"
-        if isinstance(v, bpy.types.Mesh):
-            m = DB_SENTINELS["Mesh"];       return f"{m}{_escape_with_mark(v.name, m)}{m}"
-        if isinstance(v, bpy.types.Curve):
-            m = DB_SENTINELS["Curve"];      return f"{m}{_escape_with_mark(v.name, m)}{m}"
+        sent = _DB_SENTINELS.get(type(v).__name__)
+        if sent is not None:
+            m = sent[0]
+            return f"{m}{_escape_with_mark(getattr(v, 'name', ''), m)}{m}"
     except Exception:
         pass
     return None
@@ -545,34 +592,33 @@ def serialize_default(sock):
     if isinstance(v, (int, float)):
         return f"<{v}>"
     # Vector/Color (3 or 4 floats)
-    try:
-        if hasattr(v, "__len__"):
-            seq = list(v)
-            if len(seq) in (3,4) and all(isinstance(x, (int,float)) for x in seq):
-                inside = ", ".join(str(float(x)) for x in seq)
-                return f"<{inside}>"
-    except Exception:
-        pass
+    if isinstance(v, _SEQLIKE):
+        seq = list(v)
+        if len(seq) in (3,4) and all(isinstance(x, (int,float)) for x in seq):
+            inside = ", ".join(str(float(x)) for x in seq)
+            return f"<{inside}>"
     # String
     if isinstance(v, str):
         return f"©{v}©"
     return None
 
+# 'Zero/empty' serializations we never emit as Set lines: common zero numbers,
+# zero vectors/colors, False, and the empty ©…© string marker
+_BORING_DEFAULTS = frozenset({
+    "<0>", "<0.0>", "<0.000000>", "<0, 0, 0>", "<0.0, 0.0, 0.0>",
+    "<0.0, 0.0, 0.0, 0.0>", "<False>", "©©",
+})
+
 def _is_meaningful_serialized_default(txt: str) -> bool:
     """Heuristic to avoid spamming Set lines with 'zero/empty' values."""
     if txt is None:
         return False
-    s = str(txt).strip()
-    # Numbers / common zero vectors/colors
-    if s in {"<0>", "<0.0>", "<0.000000>", "<0, 0, 0>", "<0.0, 0.0, 0.0>", "<0.0, 0.0, 0.0, 0.0>"}:
-        return False
-    # Booleans
-    if s in {"<False>"}:
-        return False
-    # Empty string marker (string defaults are wrapped with ©…©)
-    if s == "©©":
-        return False
-    return True
+    s = txt if isinstance(txt, str) else str(txt)
+    # Serialized values never contain interior whitespace worth trimming; only
+    # strip when the ends actually need it.
+    if s and (s[0].isspace() or s[-1].isspace()):
+        s = s.strip()
+    return s not in _BORING_DEFAULTS
 
 def sockets_dup_map(sockets):
     """Return dict of base name -> [ordinals] for duplicated names (1-based)."""
@@ -583,25 +629,28 @@ def sockets_dup_map(sockets):
     return {k:v for k,v in m.items() if len(v) > 1}
 
 def _display_names_for_sockets(sockets, is_inputs):
-    """Return (list_of_display_names, per_socket_map) using duplicate ordinals and ○/⦿ aliases for unnamed."""
+    """Return the list of display names using duplicate ordinals and input/output aliases for unnamed."""
     base_alias = "input" if is_inputs else "output"
-    counts = defaultdict(int)
+    counts = {}
     names = []
-    per = {}
     for s in sockets:
-        nm = (getattr(s, "name", "") or "").strip() or base_alias
-        counts[nm] += 1
-        disp = nm if counts[nm] == 1 else f"{nm}[{counts[nm]}]"
-        names.append(disp)
-        per[s] = disp
-    return names, per
-
-def declare_ports(kind, node_str, sockets, *, include_sock_meta=False):
-    """Emit Declare Inputs/Outputs lines with deterministic duplicate ordinals and unnamed aliases."""
+        nm = getattr(s, "name", "") or base_alias
+        # Socket names are almost never padded; strip only when an end needs it
+        if nm[0].isspace() or nm[-1].isspace():
+            nm = nm.strip() or base_alias
+        c = counts.get(nm, 0) + 1
+        counts[nm] = c
+        names.append(nm if c == 1 else f"{nm}[{c}]")
+    return names
+
+def declare_ports(out, kind, node_str, sockets, *, include_sock_meta=False):
+    """Append Declare Inputs/Outputs lines to out, with deterministic duplicate
+    ordinals and unnamed aliases. Writes into the caller's accumulator instead
+    of returning a throwaway list."""
     if not sockets:
-        return []
+        return
     is_inputs = (kind == "Inputs")
-    disp_list, per = _display_names_for_sockets(sockets, is_inputs)
+    disp_list = _display_names_for_sockets(sockets, is_inputs)
     parts = []
     for s, disp in zip(sockets, disp_list):
         badge = "⦿" if is_inputs else "○"
@@ -609,26 +658,7 @@ def declare_ports(kind, node_str, sockets, *, include_sock_meta=False):
         if include_sock_meta and (getattr(s, "name", "") or "").strip() != disp:
             seg += f" ; sock=<{getattr(s, 'name', '') or ''}>"
         parts.append(seg)
-    line = f"Declare {kind:<7} {node_str} : " + " , ".join(parts)
-    out = [line]
-    return out
-
-def _is_meaningful_serialized_default(txt: str) -> bool:
-    """Heuristic to avoid spamming Set lines with 'zero/empty' values."""
-    if txt is None:
-        return False
-    s = str(txt).strip()
-    # Numbers / common zero vectors/colors
-    if s in {"<0>", "<0.0>", "<0.000000>", "<0, 0, 0>", "<0.0, 0.0, 0.0>", "<0.0, 0.0, 0.0, 0.0>"}:
-        return False
-    # Booleans
-    if s in {"<False>"}:
-        return False
-    # Empty string marker (string defaults are wrapped with ©…©)
-    if s == "©©":
-        return False
-    return True
-
+    out.append(f"Declare {kind:<7} {node_str} : " + " , ".join(parts))
 
 def link_is_field(fr, to):
     """Visual heuristic only: use dotted links unless clearly geometry/object/material."""
@@ -640,24 +670,47 @@ def link_is_field(fr, to):
 def is_index_switch(n):
     return n.bl_idname == "GeometryNodeIndexSwitch" or getattr(n, "bl_label", "") == "Index Switch"
 
-def export_index_switch_adjust(n, typ, nid):
-    """Emit case count and case-label renames for Index Switch."""
-    lines = []
+def export_index_switch_adjust(out, n, typ, nid):
+    """Append case count and case-label renames for Index Switch to out."""
     items = getattr(n, "index_switch_items", None)
     if items is not None:
         count = len(items)
-        lines.append(f"Adjust  [ {typ} #{nid} ]  # Cases # to <{count}>")
+        out.append(f"Adjust  [ {typ} #{nid} ]  # Cases # to <{count}>")
         for i, it in enumerate(items, start=1):
             nm = (getattr(it, "name", "") or "").strip()
             if nm:
-                lines.append(f"Rename  [ {typ} #{nid} ] ⦿ Case {i} to ~ {nm} ~")
+                out.append(f"Rename  [ {typ} #{nid} ] ⦿ Case {i} to ~ {nm} ~")
     else:
         case_socks = [s for s in n.inputs if s.name.lower().startswith("case ")]
         if case_socks:
-            lines.append(f"Adjust  [ {typ} #{nid} ]  # Cases # to <{len(case_socks)}>")
-    return lines
+            out.append(f"Adjust  [ {typ} #{nid} ]  # Cases # to <{len(case_socks)}>")
+
+# Purely visual/readonly node properties we never serialize
+_PROP_SKIP = frozenset({
+    "name","label","parent","location","width","height","hide","mute","select",
+    "show_options","use_custom_color","color"
+})
+
+# bl_idname → [(prop, identifier, ui_name, type, is_db_pointer)]. The candidate
+# property set is a class-level invariant, so each node type is introspected once
+# instead of re-walking bl_rna.properties for every node instance.
+_PROP_CACHE = {}
+
+def _candidate_props(n, bl_id=None):
+    key = bl_id if bl_id is not None else n.bl_idname
+    props = _PROP_CACHE.get(key)
+    if props is None:
+        props = []
+        for p in n.bl_rna.properties:
+            if p.is_readonly or p.identifier in _PROP_SKIP:
+                continue
+            ptype = getattr(p, "type", "")
+            props.append((p, p.identifier, p.name, ptype,
+                          ptype == "POINTER" and hasattr(p, "fixed_type")))
+        _PROP_CACHE[key] = props
+    return props
 
-def collect_node_props(n):
+def collect_node_props(n, bl_id=None):
     """Collect (UI name, UI value) for node-level properties we want to serialize.
     - ENUM  → write UI label   as ©Label©
     - BOOLEAN → write <True>/<False>
@@ -665,50 +718,42 @@ def collect_node_props(n):
       using _serialize_datablock so the replay can recreate or proxy the target.
     """
     out = []
-    # purely visual/readonly properties to skip
-    skip = {
-        "name","label","parent","location","width","height","hide","mute","select",
-        "show_options","use_custom_color","color"
-    }
-
-    for p in n.bl_rna.properties:
-        if p.is_readonly or p.identifier in skip:
-            continue
+    for p, ident, ui_name, ptype, is_db_pointer in _candidate_props(n, bl_id):
         try:
             # 1) POINTER datablocks (this is what fixes Object Info, Set Material, etc.)
-            if getattr(p, "type", "") == "POINTER" and hasattr(p, "fixed_type"):
-                val = getattr(n, p.identifier, None)
+            if is_db_pointer:
+                val = getattr(n, ident, None)
                 if val is None:
                     continue
                 sent = _serialize_datablock(val)
                 if sent is not None:
-                    out.append((p.name, sent))
+                    out.append((ui_name, sent))
                     continue  # done with this prop
 
             # 2) ENUM → UI label
-            if p.type == 'ENUM':
+            if ptype == 'ENUM':
                 # store UI label so replay can map it back to identifier
                 from_name = ""
                 try:
-                    ident = getattr(n, p.identifier)
-                    from_name = _enum_label_safe(p, ident)
+                    key = (bl_id if bl_id is not None else n.bl_idname, ident)
+                    from_name = _enum_label_safe(p, getattr(n, ident), key)
                 except Exception:
                     pass
                 if from_name:
-                    out.append((p.name, f"©{from_name}©"))
+                    out.append((ui_name, f"©{from_name}©"))
                 continue
 
             # 3) BOOLEAN
-            if p.type == 'BOOLEAN':
-                val = bool(getattr(n, p.identifier))
-                out.append((p.name, "<True>" if val else "<False>"))
+            if ptype == 'BOOLEAN':
+                val = bool(getattr(n, ident))
+                out.append((ui_name, "<True>" if val else "<False>"))
                 continue
 
             # 4) Numeric (INT/FLOAT) — only when the node has no inputs (e.g., Integer/Float input nodes)
-            if p.type in {'INT', 'FLOAT'} and len(getattr(n, "inputs", ())) == 0:
+            if ptype in {'INT', 'FLOAT'} and len(getattr(n, "inputs", ())) == 0:
                 try:
-                    val = getattr(n, p.identifier)
-                    out.append((p.name, f"<{val}>"))
+                    val = getattr(n, ident)
+                    out.append((ui_name, f"<{val}>"))
                     continue
                 except Exception:
                     pass
@@ -724,50 +769,185 @@ def collect_node_props(n):
 
 # ---------- Core Exporter ----------
 
+class _LineBuffer:
+    """StringIO-backed line sink with the append/extend surface the emission
+    helpers already use. Avoids holding every emitted line as a separate list
+    entry until the final join; the text accumulates in one buffer."""
+    __slots__ = ("_buf",)
+
+    def __init__(self):
+        self._buf = io.StringIO()
+
+    def append(self, line):
+        w = self._buf.write
+        w(line)
+        w("\n")
+
+    def extend(self, lines):
+        w = self._buf.write
+        for ln in lines:
+            w(ln)
+            w("\n")
+
+    def getvalue(self):
+        return self._buf.getvalue()
+
 class _TreeExport:
     def __init__(self, node_tree):
         self.nt = node_tree
-        self.lines_groups = []
-        self.lines_top = []
+        self.lines_groups = _LineBuffer()
+        self.lines_top = _LineBuffer()
         self._visited_groups = set()
+        # Per-tree link indices, rebuilt at the top of each export pass
+        self._by_to = {}
+        self._by_from = {}
+        # Memoized reroute-chain resolutions, keyed by socket pointer
+        self._rsrc = {}
+        self._rdst = {}
+        self._sock_pos = {}
 
     def _enumerate_nodes(self, nodes):
-        """Per-tree numbering: type -> running count; returns dict node -> (typ, #id)."""
+        """Per-tree numbering: type -> running count.
+        Returns dict node -> (typ, #id, bl_idname, raw_label, variant); the RNA
+        strings are read once here so later phases don't re-probe them per node."""
         counts = defaultdict(int)
         idx = {}
         for n in nodes:
-            if is_reroute(n) or is_frame(n):
+            bl_id = n.bl_idname
+            if bl_id in _REROUTE_IDS or bl_id == "NodeFrame":
                 continue
-            typ = norm_type(n)
+            typ = norm_type(n, bl_id)
             counts[typ] += 1
-            idx[n] = (typ, counts[typ])
+            idx[n] = (typ, counts[typ], bl_id, n.label or "", node_variant_label(n, bl_id))
         return idx
 
+    def _enter_tree(self, ng):
+        """Rebuild the per-tree link indices and drop memoized reroute resolutions."""
+        self._by_to, self._by_from = _build_link_maps(ng)
+        self._rsrc.clear()
+        self._rdst.clear()
+        # Socket pointer → position within its node's inputs/outputs collection
+        pos = self._sock_pos = {}
+        for n in ng.nodes:
+            for coll in (n.inputs, n.outputs):
+                for i, s in enumerate(coll):
+                    try:
+                        pos[s.as_pointer()] = i
+                    except Exception:
+                        continue
+
+    def _socket_position(self, sock):
+        """O(1) socket_position via the prebuilt map; falls back to the linear scan."""
+        try:
+            sp = sock.as_pointer()
+        except Exception:
+            return socket_position(sock)
+        p = self._sock_pos.get(sp)
+        return p if p is not None else socket_position(sock)
+
+    def _resolve_source(self, from_sock):
+        """Walk a reroute chain back to its real (socket, pointer) pair, memoized per
+        pass. Every hop on the path is cached to the terminal pair (path compression)."""
+        cache = self._rsrc
+        ptr = from_sock.as_pointer()
+        hit = cache.get(ptr)
+        if hit is not None:
+            return hit
+        by_to = self._by_to
+        s = from_sock
+        path = [ptr]
+        while is_reroute(s.node):
+            ln = by_to.get(s.node.inputs[0].as_pointer())
+            if not ln:
+                break
+            s = ln.from_socket
+            ptr = s.as_pointer()
+            path.append(ptr)
+        hit = (s, ptr)
+        for p in path:
+            cache[p] = hit
+        return hit
+
+    def _resolve_dest(self, to_sock):
+        """Walk a reroute chain forward to its real (socket, pointer) pair, memoized per pass."""
+        cache = self._rdst
+        ptr = to_sock.as_pointer()
+        hit = cache.get(ptr)
+        if hit is not None:
+            return hit
+        by_from = self._by_from
+        s = to_sock
+        path = [ptr]
+        while is_reroute(s.node):
+            outs = by_from.get(s.node.outputs[0].as_pointer())
+            if not outs:
+                break
+            s = outs[0].to_socket
+            ptr = s.as_pointer()
+            path.append(ptr)
+        hit = (s, ptr)
+        for p in path:
+            cache[p] = hit
+        return hit
+
+    def _iter_links_collapsed(self, ng):
+        """Yield (from_socket, to_socket) between non-reroute/frame nodes, collapsing reroutes."""
+        seen = set()
+        for ln in ng.links:
+            dst, dptr = self._resolve_dest(ln.to_socket)
+            src, sptr = self._resolve_source(ln.from_socket)
+            if is_reroute(src.node) or is_reroute(dst.node) or is_frame(src.node) or is_frame(dst.node):
+                continue
+            # Socket RNA pointers dedupe while distinguishing multiple links into a
+            # multi-input; the resolvers already paid for them during the walk.
+            key = (sptr, dptr)
+            if key in seen:
+                continue
+            seen.add(key)
+            yield (src, dst)
+
     def _export_group_block(self, ng):
         gname = ng.name
         if gname in self._visited_groups:
             return
         self._visited_groups.add(gname)
 
+        self._enter_tree(ng)
+        # Local aliases: the loops below hit these builtins dozens of times per
+        # socket, and LOAD_FAST beats LOAD_GLOBAL
+        _getattr, _hasattr = getattr, hasattr
         nodes = [n for n in ng.nodes if not is_reroute(n) and not is_frame(n)]
         enum = self._enumerate_nodes(nodes)
-
-        out = [f"START GROUP NAMED {gname}"]
+        # "[ Type #id ]" and the Set header recur across the declare/Set/link
+        # passes; format them once per node instead of per use
+        node_str_of = {n: f"[ {t} #{i} ]" for n, (t, i, _b, _l, _v) in enum.items()}
+        set_hdr_of = {n: f"Set  {s}:" for n, s in node_str_of.items()}
+
+        # Partition the interface once; the synthetic-reroute, declare and meta
+        # passes all consume the same INPUT/OUTPUT split
+        iface_items = list(ng.interface.items_tree)
+        gi_items = [it for it in iface_items
+                    if _getattr(it, "item_type", "") == 'SOCKET' and it.in_out == 'INPUT']
+        go_items = [it for it in iface_items
+                    if _getattr(it, "item_type", "") == 'SOCKET' and it.in_out == 'OUTPUT']
+
+        # Append straight into the shared line buffer; run() concatenates both
+        out = self.lines_groups
+        out.append(f"START GROUP NAMED {gname}")
 
         # Create + Rename + Index Switch Adjust
         for n in nodes:
-            typ, nid = enum[n]
-            if n.bl_idname == "GeometryNodeGroup":
+            typ, nid, bl_id, label, variant = enum[n]
+            if bl_id == "GeometryNodeGroup":
                 ref_name = n.node_tree.name if n.node_tree else "Unnamed"
                 out.append(f"Create  [ Group |  | ] ~ {ref_name} ~ #{nid} ; type=GeometryNodeGroup")
             else:
-                variant = node_variant_label(n)
-                friendly = (n.label or "").strip()
-                out.append(f"Create  [ {typ} | {variant or '—'} | ] ~ {friendly} ~ #{nid} ; type={n.bl_idname}")
-            if n.label:
-                out.append(f"Rename  [ {typ} #{nid} ] to ~ {n.label} ~")
+                friendly = label.strip()
+                out.append(f"Create  [ {typ} | {variant or '—'} | ] ~ {friendly} ~ #{nid} ; type={bl_id}")
+            if label:
+                out.append(f"Rename  {node_str_of[n]} to ~ {label} ~")
             if is_index_switch(n):
-                out.extend(export_index_switch_adjust(n, typ, nid))
+                export_index_switch_adjust(out, n, typ, nid)
 
         # --- v1.3 test: synthesize reroutes for *unlinked* GI outputs (group scope) ---
         gi_placeholder_links = []   # (gi_id, label, reroute_id) in group scope
@@ -775,20 +955,20 @@ class _TreeExport:
             gi_node = None
             gi_id = None
             for _n in nodes:
-                if _n.bl_idname == "NodeGroupInput":
+                if enum[_n][2] == "NodeGroupInput":
                     gi_node = _n
                     gi_id = enum[_n][1]
                     break
             if gi_node is not None and gi_id is not None:
                 rr_auto = 0
-                gi_items = [item for item in ng.interface.items_tree
-                            if getattr(item, "item_type", "") == 'SOCKET' and item.in_out == 'INPUT']
                 for idx, it in enumerate(gi_items):
-                    label = (getattr(it, "name", "") or "").strip()
+                    label = (_getattr(it, "name", "") or "").strip()
                     if not label:
                         continue
                     s = gi_node.outputs[idx]
-                    if not any(lnk.from_socket == s for lnk in ng.links):
+                    # _by_from is keyed by from-socket pointer, so membership is the
+                    # "has any outgoing link" test without rescanning ng.links
+                    if s.as_pointer() not in self._by_from:
                         rr_auto += 1
                         out.append(f"Create  [ Reroute | — | ] ~  ~ #{rr_auto} ; type=NodeReroute")
                         gi_placeholder_links.append((gi_id, label, rr_auto))
@@ -798,31 +978,40 @@ class _TreeExport:
 
         # Declare ports
         for n in nodes:
-            typ, nid = enum[n]
-            node_str = f"[ {typ} #{nid} ]"
+            typ, nid = enum[n][:2]
+            node_str = node_str_of[n]
 
             if typ == "Group Input":
-                gi = [item for item in ng.interface.items_tree
-                    if getattr(item, "item_type", "") == 'SOCKET' and item.in_out == 'INPUT']
-
-                out.extend(declare_ports("Outputs", node_str, gi))
+                gi = gi_items
+                declare_ports(out, "Outputs", node_str, gi)
                 # --- v1.3: Expose GI outputs that are unlinked or only dead-end via reroutes ---
                 try:
-                    nt = self.nt
-                    names, _ = _display_names_for_sockets(n.outputs, False)
+                    by_from = self._by_from
+                    names = _display_names_for_sockets(n.outputs, False)
+                    # Shared across this node's sockets: reroute chains fanning out
+                    # from several GI outputs get walked once, not per socket.
+                    dead_cache = {}
+                    # Each BFS step follows at least one link, so the link count
+                    # bounds any acyclic walk; +1 covers the starting socket.
+                    budget = len(ng.links) + 1
 
                     def _gi_dead_end(sock):
                         # BFS forward through reroutes; if any path reaches a non-reroute consumer, NOT dead-end.
-                        frontier, seen, steps = [sock], set(), 0
-                        while frontier and steps < 1024:
-                            s = frontier.pop()
+                        root_sid = _getattr(sock, "as_pointer", lambda: id(sock))()
+                        hit = dead_cache.get(root_sid)
+                        if hit is not None:
+                            return hit
+                        frontier, seen, steps = deque((sock,)), set(), 0
+                        while frontier and steps < budget:
+                            s = frontier.popleft()
                             steps += 1
-                            sid = getattr(s, "as_pointer", lambda: id(s))()
+                            sid = _getattr(s, "as_pointer", lambda: id(s))()
                             if sid in seen:
                                 continue
                             seen.add(sid)
-                            outs = [ln for ln in nt.links if ln.from_socket == s]
+                            outs = by_from.get(sid)
                             if not outs:
+                                dead_cache[root_sid] = True
                                 return True  # no consumers at all
                             for lnk in outs:
                                 nd = lnk.to_node
@@ -830,14 +1019,21 @@ class _TreeExport:
                                     try:
                                         frontier.append(nd.outputs[0])
                                     except Exception:
+                                        dead_cache[root_sid] = True
                                         return True  # broken reroute behaves like dead-end
                                 else:
+                                    dead_cache[root_sid] = False
                                     return False  # real consumer found
-                        return True  # frontier exhausted without finding a real consumer
+                        # Frontier exhausted without finding a real consumer: everything
+                        # visited was fully explored, so the answer holds for all of it.
+                        for sid in seen:
+                            dead_cache[sid] = True
+                        dead_cache[root_sid] = True
+                        return True
 
                     for s, label in zip(n.outputs, names):
                         if _gi_dead_end(s):
-                            out.append(f"Expose  [ {typ} #{nid} ] ○ {label}")
+                            out.append(f"Expose  {node_str} ○ {label}")
                 except Exception:
                     pass
                 # -------------------------------------------------------------------------------
@@ -848,134 +1044,121 @@ class _TreeExport:
                 # We reuse serialize_default(...) by wrapping each interface item in a tiny shim
                 # exposing .default_value so the serializer can do datablock sentinels etc.
                 kv = []
-                for it in gi:
-                    try:
+                try:
+                    for it in gi:
                         # Interface items have names shown in the UI; that is the display label we already declare.
-                        disp = (getattr(it, "name", "") or "").strip()
+                        disp = (_getattr(it, "name", "") or "").strip()
                         if not disp:
                             continue
                         # Some interface items expose .default_value directly. If not, skip.
-                        if not hasattr(it, "default_value"):
+                        dv = _getattr(it, "default_value", _MISSING)
+                        if dv is _MISSING:
                             continue
-                        class _Shim:
-                            def __init__(self, dv):
-                                self.default_value = dv
-                        sv = serialize_default(_Shim(getattr(it, "default_value")))
+                        fn = _SERIALIZE_BY_TYPE.get(type(dv))
+                        sv = fn(dv) if fn else serialize_default(_DVShim(dv))
                         if sv is not None:
                             kv.append((disp, sv))
-                    except Exception:
-                        pass
+                except Exception:
+                    pass
                 if kv:
-                    out.append(f"Set  {node_str}:")
+                    out.append(set_hdr_of[n])
                     for k, v in kv:
                         out.append(f"§ {k} § to {v}")
 
                 # --- NEW: interface meta for Group Input (per-group) ---
                 # --- NEW: interface meta for Group Input (per-group) ---
                 meta_lines = []
-                for it in gi:
-                    try:
-                        disp = (getattr(it, "name", "") or "").strip()
+                try:
+                    for it in gi:
+                        disp = (_getattr(it, "name", "") or "").strip()
                         if not disp:
                             continue
 
                         # Description
-                        desc = (getattr(it, "description", "") or "").strip()
+                        desc = (_getattr(it, "description", "") or "").strip()
                         if desc:
-                            meta_lines.append(f"§ {disp}::Description § to ~{desc.replace('~','-')}~")
-
-                        # Helper to append only-when-present
-                        def _emit(suffix, val, *, quote=False):
-                            if val is None:
-                                return
-                            if quote:
-                                meta_lines.append(f"§ {disp}::{suffix} § to {repr(val)}")
-                            else:
-                                if isinstance(val, bool):
-                                    meta_lines.append(f"§ {disp}::{suffix} § to " + ("<True>" if val else "<False>"))
-                                elif isinstance(val, (int, float)):
-                                    meta_lines.append(f"§ {disp}::{suffix} § to <{val}>")
-                                else:
-                                    meta_lines.append(f"§ {disp}::{suffix} § to {val}")
+                            meta_lines.append(f"§ {disp}::Description § to ~{desc.translate(_TILDE_TABLE)}~")
 
                         # Exact interface socket idname when available (preferred)
-                        stype = None
-                        if hasattr(it, "bl_socket_idname"):
-                            stype = getattr(it, "bl_socket_idname", None)
-                        elif hasattr(it, "socket_type"):
-                            stype = getattr(it, "socket_type", None)
-                        _emit("Socket Type", stype, quote=True)
-
-                        # Structure (FIELD / VALUE)
-                        if hasattr(it, "structure_type"):
-                            _emit("Structure Type", getattr(it, "structure_type"), quote=True)
-
-                        # Limits / UI
-                        if hasattr(it, "subtype"):
-                            _emit("Subtype", getattr(it, "subtype"), quote=True)
-                        if hasattr(it, "min_value"):
-                            _emit("Min", getattr(it, "min_value"))
-                        if hasattr(it, "max_value"):
-                            _emit("Max", getattr(it, "max_value"))
-                        if hasattr(it, "hide_value"):
-                            _emit("Hide Value", bool(getattr(it, "hide_value")))
-                        if hasattr(it, "hide_in_modifier"):
-                            _emit("Hide in Modifier", bool(getattr(it, "hide_in_modifier")))
-                        if hasattr(it, "default_attribute"):
-                            _emit("Default Attribute", getattr(it, "default_attribute"), quote=True)
-                    except Exception:
-                        pass
-
-                if meta_lines:
-                    out.append(f"Set  {node_str}:")
-                    out.extend(meta_lines)
-
+                        stype = _getattr(it, "bl_socket_idname", _MISSING)
+                        if stype is _MISSING:
+                            stype = _getattr(it, "socket_type", None)
+                        _emit_meta(meta_lines, disp, "Socket Type", stype, quote=True)
+
+                        # Structure / limits / UI flags, table-driven
+                        for attr, label, mode in _META_SPEC:
+                            v = _getattr(it, attr, _MISSING)
+                            if v is _MISSING:
+                                continue
+                            if mode == "bool":
+                                _emit_meta(meta_lines, disp, label, bool(v))
+                            else:
+                                _emit_meta(meta_lines, disp, label, v, quote=(mode == "quote"))
+                except Exception:
+                    pass
 
                 if meta_lines:
-                    out.append(f"Set  {node_str}:")
+                    out.append(set_hdr_of[n])
                     out.extend(meta_lines)
 
 
 
             elif typ == "Group Output":
-                go = [item for item in ng.interface.items_tree
-                      if getattr(item, "item_type", "") == 'SOCKET' and item.in_out == 'OUTPUT']
-                out.extend(declare_ports("Inputs", node_str, go))
+                go = go_items
+                declare_ports(out, "Inputs", node_str, go)
                 # --- v1.3: Expose GO inputs that are unlinked or only dead-end via reroutes ---
                 try:
-                    nt = self.nt
-                    names, _ = _display_names_for_sockets(n.inputs, True)
+                    by_to = self._by_to
+                    names = _display_names_for_sockets(n.inputs, True)
+                    # Shared across this node's inputs: a reroute chain feeding
+                    # several GO sockets is walked once, and since the walk is a
+                    # single backward path, every hop shares the final verdict.
+                    dead_cache = {}
 
                     def _go_dead_end(sock):
                         # Walk backward through reroutes; if no real source, it’s dead-end.
-                        steps = 0
-                        s = sock
-                        while steps < 1024:
-                            steps += 1
-                            ln = _incoming_link_for(s)
-                            if not ln:
-                                return True  # no source at all
+                        sp = sock.as_pointer()
+                        hit = dead_cache.get(sp)
+                        if hit is not None:
+                            return hit
+                        # seen node pointers give real cycle detection instead
+                        # of the old arbitrary step budget
+                        seen = set()
+                        path = [sp]
+                        verdict = True
+                        while True:
+                            ln = by_to.get(sp)
+                            if ln is None:
+                                break  # no source at all
                             nd = ln.from_node
-                            if is_reroute(nd):
-                                try:
-                                    s = nd.inputs[0]
-                                except Exception:
-                                    return True
-                                continue
-                            return False  # real source exists
-                        return True
+                            ndp = nd.as_pointer()
+                            if ndp in seen:
+                                break  # reroute cycle: dead-end
+                            seen.add(ndp)
+                            if not is_reroute(nd):
+                                verdict = False  # real source exists
+                                break
+                            sp = nd.inputs[0].as_pointer()
+                            hit = dead_cache.get(sp)
+                            if hit is not None:
+                                verdict = hit
+                                break
+                            path.append(sp)
+                        for p in path:
+                            dead_cache[p] = verdict
+                        return verdict
 
                     for s, label in zip(n.inputs, names):
                         if _go_dead_end(s):
-                            out.append(f"Expose  [ {typ} #{nid} ] ⦿ {label}")
+                            out.append(f"Expose  {node_str} ⦿ {label}")
                 except Exception:
                     pass
                 # -------------------------------------------------------------------------------
 
 
             else:
-                out.extend(declare_ports("Inputs",  node_str, n.inputs))
-                out.extend(declare_ports("Outputs", node_str, n.outputs))
+                declare_ports(out, "Inputs",  node_str, n.inputs)
+                declare_ports(out, "Outputs", node_str, n.outputs)
 
         # --------------------------------------------------------------------------------
         # Set (unlinked defaults + enums/toggles) — use display names so duplicates get [2], [3], …
@@ -983,7 +1166,7 @@ class _TreeExport:
             kv = []
 
             # 1) Unlinked INPUT socket defaults
-            in_names, _ = _display_names_for_sockets(n.inputs, True)
+            in_names = _display_names_for_sockets(n.inputs, True)
             for s, disp in zip(n.inputs, in_names):
                 if s.is_linked:
                     continue
@@ -992,20 +1175,19 @@ class _TreeExport:
                     kv.append((disp, sv))
 
             # 2) OUTPUT socket defaults (e.g. 'Value' on a Value node)
-            out_names, _ = _display_names_for_sockets(n.outputs, False)
+            out_names = _display_names_for_sockets(n.outputs, False)
             for s, disp in zip(n.outputs, out_names):
-                if not hasattr(s, "default_value"):
+                if not _hasattr(s, "default_value"):
                     continue
                 sv = serialize_default(s)
                 if _is_meaningful_serialized_default(sv):
                     kv.append((disp, sv))
 
             # 3) Node RNA props (enums/toggles/number props you already collect)
-            kv.extend(collect_node_props(n))
+            kv.extend(collect_node_props(n, enum[n][2]))
 
             if kv:
-                typ, nid = enum[n]
-                out.append(f"Set  [ {typ} #{nid} ]:")
+                out.append(set_hdr_of[n])
                 for k, v in kv:
                     out.append(f"§ {k} § to {v}")
 
@@ -1016,51 +1198,74 @@ class _TreeExport:
                 out.append(f"Connect  [ Group Input #{_gi_id} ] ○ {_label}  to  [ Reroute #{_rr_id} ] ⦿ Input")
 
 
-        # Links (reroute-collapsed)
-        for fr, to in iter_links_collapsed(ng):
+        # Links (reroute-collapsed) — display names computed once per node,
+        # not once per link endpoint
+        dn_in = {n: _display_names_for_sockets(n.inputs, True) for n in enum}
+        dn_out = {n: _display_names_for_sockets(n.outputs, False) for n in enum}
+        ns_get = node_str_of.get
+        for fr, to in self._iter_links_collapsed(ng):
             nf, nt = fr.node, to.node
-            if nf not in enum or nt not in enum:
+            # Single .get doubles as membership test and lookup (enum,
+            # node_str_of and the dn_* dicts share the same key set)
+            nsf = ns_get(nf)
+            if nsf is None:
+                continue
+            nst = ns_get(nt)
+            if nst is None:
                 continue
-            tf, idf = enum[nf]
-            tt, idt = enum[nt]
             dotted = "Connect⋯" if link_is_field(fr, to) else "Connect"
-            in_names, _ = _display_names_for_sockets(nt.inputs, True)
-            out_names, _= _display_names_for_sockets(nf.outputs, False)
-            fi = socket_position(fr)
-            ti = socket_position(to)
+            in_names = dn_in[nt]
+            out_names = dn_out[nf]
+            fi = self._socket_position(fr)
+            ti = self._socket_position(to)
             onm = out_names[fi] if 0 <= fi < len(out_names) else (fr.name or "output")
             inm = in_names[ti]  if 0 <= ti < len(in_names)  else (to.name or "input")
-            out.append(f"{dotted}  [ {tf} #{idf} ] ○ {onm}  to  [ {tt} #{idt} ] ⦿ {inm}")
+            out.append(f"{dotted}  {nsf} ○ {onm}  to  {nst} ⦿ {inm}")
 
         # PairZone (Simulation / Repeat)
         self._emit_zone_pairs(ng, enum, out)
         out.append(f"END GROUP NAMED {gname}")
-        self.lines_groups.extend(out)
 
         # Recurse into nested groups
         for n in nodes:
-            if n.bl_idname == "GeometryNodeGroup" and n.node_tree:
+            if enum[n][2] == "GeometryNodeGroup" and n.node_tree:
                 self._export_group_block(n.node_tree)
 
     def _export_top(self):
+        self._enter_tree(self.nt)
+        # Local aliases: the loops below hit these builtins dozens of times per
+        # socket, and LOAD_FAST beats LOAD_GLOBAL
+        _getattr, _hasattr = getattr, hasattr
         nodes = [n for n in self.nt.nodes if not is_reroute(n) and not is_frame(n)]
         enum = self._enumerate_nodes(nodes)
-        out = []
+        # "[ Type #id ]" and the Set header recur across the declare/Set/link
+        # passes; format them once per node instead of per use
+        node_str_of = {n: f"[ {t} #{i} ]" for n, (t, i, _b, _l, _v) in enum.items()}
+        set_hdr_of = {n: f"Set  {s}:" for n, s in node_str_of.items()}
+
+        # Partition the interface once; the synthetic-reroute, declare and meta
+        # passes all consume the same INPUT/OUTPUT split
+        iface_items = list(self.nt.interface.items_tree)
+        gi_items = [it for it in iface_items
+                    if _getattr(it, "item_type", "") == 'SOCKET' and it.in_out == 'INPUT']
+        go_items = [it for it in iface_items
+                    if _getattr(it, "item_type", "") == 'SOCKET' and it.in_out == 'OUTPUT']
+        # Append straight into the shared line buffer; run() concatenates both
+        out = self.lines_top
 
         # Create + Rename + Index Switch Adjust
         for n in nodes:
-            typ, nid = enum[n]
-            if n.bl_idname == "GeometryNodeGroup":
+            typ, nid, bl_id, label, variant = enum[n]
+            if bl_id == "GeometryNodeGroup":
                 ref_name = n.node_tree.name if n.node_tree else "Unnamed"
                 out.append(f"Create  [ Group |  | ] ~ {ref_name} ~ #{nid} ; type=GeometryNodeGroup")
             else:
-                variant = node_variant_label(n)
-                friendly = (n.label or "").strip()
-                out.append(f"Create  [ {typ} | {variant or '—'} | ] ~ {friendly} ~ #{nid} ; type={n.bl_idname}")
-            if n.label:
-                out.append(f"Rename  [ {typ} #{nid} ] to ~ {n.label} ~")
+                friendly = label.strip()
+                out.append(f"Create  [ {typ} | {variant or '—'} | ] ~ {friendly} ~ #{nid} ; type={bl_id}")
+            if label:
+                out.append(f"Rename  {node_str_of[n]} to ~ {label} ~")
             if is_index_switch(n):
-                out.extend(export_index_switch_adjust(n, typ, nid))
+                export_index_switch_adjust(out, n, typ, nid)
 
         # Declare ports
 
@@ -1072,7 +1277,7 @@ class _TreeExport:
             gi_node = None
             gi_id = None
             for _n in nodes:
-                if _n.bl_idname == "NodeGroupInput":
+                if enum[_n][2] == "NodeGroupInput":
                     gi_node = _n
                     gi_id = enum[_n][1]
                     break
@@ -1080,15 +1285,13 @@ class _TreeExport:
                 # Number our synthetic reroutes locally (Reroute #1, #2, …)
                 rr_auto = 0
                 # use interface items for labels; skip blanks
-                gi_items = [item for item in self.nt.interface.items_tree
-                            if getattr(item, "item_type", "") == 'SOCKET' and item.in_out == 'INPUT']
                 for idx, it in enumerate(gi_items):
-                    label = (getattr(it, "name", "") or "").strip()
+                    label = (_getattr(it, "name", "") or "").strip()
                     if not label:
                         continue
                     s = gi_node.outputs[idx]
-                    # Only sockets with *no* outgoing links
-                    if not any(lnk.from_socket == s for lnk in self.nt.links):
+                    # Only sockets with *no* outgoing links (_by_from keys are from-socket pointers)
+                    if s.as_pointer() not in self._by_from:
                         rr_auto += 1
                         out.append(f"Create  [ Reroute | — | ] ~  ~ #{rr_auto} ; type=NodeReroute")
                         gi_placeholder_links.append((gi_id, label, rr_auto))
@@ -1097,137 +1300,103 @@ class _TreeExport:
         # -------------------------------------------------------------------------------------------
 
         for n in nodes:
-            typ, nid = enum[n]
-            node_str = f"[ {typ} #{nid} ]"
+            typ, nid = enum[n][:2]
+            node_str = node_str_of[n]
 
             if typ == "Group Input":
-                gi = [item for item in self.nt.interface.items_tree
-                      if getattr(item, "item_type", "") == 'SOCKET' and item.in_out == 'INPUT']
-                out.extend(declare_ports("Outputs", node_str, gi))
+                gi = gi_items
+                declare_ports(out, "Outputs", node_str, gi)
 
                 # --- NEW: top-level Group Input defaults ---
                 kv = []
-                for it in gi:
-                    try:
-                        disp = (getattr(it, "name", "") or "").strip()
+                try:
+                    for it in gi:
+                        disp = (_getattr(it, "name", "") or "").strip()
                         if not disp:
                             continue
-                        if not hasattr(it, "default_value"):
+                        dv = _getattr(it, "default_value", _MISSING)
+                        if dv is _MISSING:
                             continue
-                        class _Shim:
-                            def __init__(self, dv): self.default_value = dv
-                        sv = serialize_default(_Shim(getattr(it, "default_value")))
+                        fn = _SERIALIZE_BY_TYPE.get(type(dv))
+                        sv = fn(dv) if fn else serialize_default(_DVShim(dv))
                         if sv is not None:
                             kv.append((disp, sv))
-                    except Exception:
-                        pass
+                except Exception:
+                    pass
                 if kv:
-                    out.append(f"Set  {node_str}:")
+                    out.append(set_hdr_of[n])
                     for k, v in kv:
                         out.append(f"§ {k} § to {v}")
 
                 # --- NEW: top-level Group Input meta (descriptions + flags/limits/attrs) ---
                 meta_lines = []
-                for it in gi:
-                    try:
-                        disp = (getattr(it, "name", "") or "").strip()
+                try:
+                    for it in gi:
+                        disp = (_getattr(it, "name", "") or "").strip()
                         if not disp:
                             continue
 
                         # Description
-                        desc = (getattr(it, "description", "") or "").strip()
+                        desc = (_getattr(it, "description", "") or "").strip()
                         if desc:
-                            meta_lines.append(f"§ {disp}::Description § to ~{desc.replace('~','-')}~")
-
-                        # Helper to append only-when-present
-                        def _emit(suffix, val, *, quote=False):
-                            if val is None:
-                                return
-                            if quote:
-                                meta_lines.append(f"§ {disp}::{suffix} § to {repr(val)}")
-                            else:
-                                if isinstance(val, bool):
-                                    meta_lines.append(f"§ {disp}::{suffix} § to " + ("<True>" if val else "<False>"))
-                                elif isinstance(val, (int, float)):
-                                    meta_lines.append(f"§ {disp}::{suffix} § to <{val}>")
-                                else:
-                                    meta_lines.append(f"§ {disp}::{suffix} § to {val}")
+                            meta_lines.append(f"§ {disp}::Description § to ~{desc.translate(_TILDE_TABLE)}~")
 
                         # Exact interface socket idname when available (preferred)
-                        stype = None
-                        if hasattr(it, "bl_socket_idname"):
-                            stype = getattr(it, "bl_socket_idname", None)
-                        elif hasattr(it, "socket_type"):
-                            stype = getattr(it, "socket_type", None)
-                        _emit("Socket Type", stype, quote=True)
-
-                        # Structure (FIELD / VALUE)
-                        if hasattr(it, "structure_type"):
-                            _emit("Structure Type", getattr(it, "structure_type"), quote=True)
-
-                        # Limits / UI
-                        if hasattr(it, "subtype"):
-                            _emit("Subtype", getattr(it, "subtype"), quote=True)
-                        if hasattr(it, "min_value"):
-                            _emit("Min", getattr(it, "min_value"))
-                        if hasattr(it, "max_value"):
-                            _emit("Max", getattr(it, "max_value"))
-                        if hasattr(it, "hide_value"):
-                            _emit("Hide Value", bool(getattr(it, "hide_value")))
-                        if hasattr(it, "hide_in_modifier"):
-                            _emit("Hide in Modifier", bool(getattr(it, "hide_in_modifier")))
-                        if hasattr(it, "default_attribute"):
-                            _emit("Default Attribute", getattr(it, "default_attribute"), quote=True)
-                    except Exception:
-                        pass
+                        stype = _getattr(it, "bl_socket_idname", _MISSING)
+                        if stype is _MISSING:
+                            stype = _getattr(it, "socket_type", None)
+                        _emit_meta(meta_lines, disp, "Socket Type", stype, quote=True)
+
+                        # Structure / limits / UI flags, table-driven
+                        for attr, label, mode in _META_SPEC:
+                            v = _getattr(it, attr, _MISSING)
+                            if v is _MISSING:
+                                continue
+                            if mode == "bool":
+                                _emit_meta(meta_lines, disp, label, bool(v))
+                            else:
+                                _emit_meta(meta_lines, disp, label, v, quote=(mode == "quote"))
+                except Exception:
+                    pass
 
                 if meta_lines:
-                    out.append(f"Set  {node_str}:")
+                    out.append(set_hdr_of[n])
                     out.extend(meta_lines)
 
             elif typ == "Group Output":
-                go = [item for item in self.nt.interface.items_tree
-                      if getattr(item, "item_type", "") == 'SOCKET' and item.in_out == 'OUTPUT']
-                out.extend(declare_ports("Inputs", node_str, go))
+                go = go_items
+                declare_ports(out, "Inputs", node_str, go)
                 # Meta for Group Output sockets (no default values here)
                 meta_lines = []
-                for it in go:
-                    try:
-                        disp = (getattr(it, "name", "") or "").strip()
+                try:
+                    for it in go:
+                        disp = (_getattr(it, "name", "") or "").strip()
                         if not disp:
                             continue
-                        def _emit(suffix, val, *, quote=False):
-                            if val is None:
-                                return
-                            if quote:
-                                meta_lines.append(f"§ {disp}::{suffix} § to {repr(val)}")
+                        stype = _getattr(it, "bl_socket_idname", _MISSING)
+                        if stype is _MISSING:
+                            stype = _getattr(it, "socket_type", None)
+                        _emit_meta(meta_lines, disp, "Socket Type", stype, quote=True)
+                        for attr, label, mode in _META_SPEC_GO:
+                            v = _getattr(it, attr, _MISSING)
+                            if v is _MISSING:
+                                continue
+                            if mode == "bool":
+                                _emit_meta(meta_lines, disp, label, bool(v))
                             else:
-                                if isinstance(val, bool):
-                                    meta_lines.append(f"§ {disp}::{suffix} § to " + ("<True>" if val else "<False>"))
-                                elif isinstance(val, (int, float)):
-                                    meta_lines.append(f"§ {disp}::{suffix} § to <{val}>")
-                                else:
-                                    meta_lines.append(f"§ {disp}::{suffix} § to {val}")
-                        stype = getattr(it, "bl_socket_idname", None) if hasattr(it, "bl_socket_idname") else getattr(it, "socket_type", None)
-                        _emit("Socket Type", stype, quote=True)
-                        if hasattr(it, "structure_type"):
-                            _emit("Structure Type", getattr(it, "structure_type"), quote=True)
-                        if hasattr(it, "subtype"):
-                            _emit("Subtype", getattr(it, "subtype"), quote=True)
-                        if hasattr(it, "hide_in_modifier"):
-                            _emit("Hide in Modifier", bool(getattr(it, "hide_in_modifier")))
-                        desc = (getattr(it, "description", "") or "").strip()
+                                _emit_meta(meta_lines, disp, label, v, quote=(mode == "quote"))
+                        desc = (_getattr(it, "description", "") or "").strip()
                         if desc:
-                            meta_lines.append(f"§ {disp}::Description § to ~{desc.replace('~','-')}~")
-                    except Exception:
-                        pass
+                            meta_lines.append(f"§ {disp}::Description § to ~{desc.translate(_TILDE_TABLE)}~")
+                except Exception:
+                    pass
                 if meta_lines:
-                    out.append(f"Set  {node_str}:")
+                    out.append(set_hdr_of[n])
                     out.extend(meta_lines)
 
             else:
-                out.extend(declare_ports("Inputs",  node_str, n.inputs))
-                out.extend(declare_ports("Outputs", node_str, n.outputs))
+                declare_ports(out, "Inputs",  node_str, n.inputs)
+                declare_ports(out, "Outputs", node_str, n.outputs)
 
         # Set (unlinked defaults + enums/toggles) — use display names so duplicates get [2], [3], …
         for n in nodes:
@@ -1236,41 +1405,35 @@ class _TreeExport:
             # 0) SPECIAL: Group Input interface — write defaults & metadata by port label
             try:
                 if n.bl_idname in {'NodeGroupInput','GeometryNodeGroupInput'}:
-                    iface = n.id_data.interface
-                    # collect INPUT-side interface sockets
-                    items = [it for it in getattr(iface, 'items_tree', [])
-                            if getattr(it, 'item_type', '') == 'SOCKET' and getattr(it, 'in_out', '') == 'INPUT']
+                    # n.id_data is self.nt here, so the partition above applies
+                    items = gi_items
                     for it in items:
-                        name = (getattr(it, 'name','') or '').strip()
+                        name = (_getattr(it, 'name','') or '').strip()
                         # default value (any type, including datablocks)
-                        if hasattr(it, 'default_value'):
-                            dv = getattr(it, 'default_value')
-                            kv.append((name, serialize_any(dv)))  # exports as `§ Port § to <...>`
+                        dv = _getattr(it, 'default_value', _MISSING)
+                        if dv is not _MISSING:
+                            sv = _serialize_user_value(dv)  # exports as `§ Port § to <...>`
+                            if sv is not None:
+                                kv.append((name, sv))
                         # metadata (emit only if meaningful/non-empty)
-                        if getattr(it, 'description', ''):
+                        if _getattr(it, 'description', ''):
                             kv.append((f"{name}::Description", f"~{it.description}~"))
-                        if hasattr(it, 'default_attribute') and it.default_attribute:
-                            kv.append((f"{name}::Default Attribute", f"{it.default_attribute}"))
-                        if hasattr(it, 'subtype') and it.subtype:
-                            kv.append((f"{name}::Subtype", f"{it.subtype}"))
-                        if hasattr(it, 'min_value'):
-                            kv.append((f"{name}::Min", f"<{it.min_value}>"))
-                        if hasattr(it, 'max_value'):
-                            kv.append((f"{name}::Max", f"<{it.max_value}>"))
-                        if hasattr(it, 'hide_value') and it.hide_value:
-                            kv.append((f"{name}::Hide Value", "True"))
-                        if hasattr(it, 'hide_in_modifier') and it.hide_in_modifier:
-                            kv.append((f"{name}::Hide in Modifier", "True"))
-                        if hasattr(it, 'structure_type') and it.structure_type:
-                            kv.append((f"{name}::Structure Type", f"{it.structure_type}"))
-                        if hasattr(it, 'socket_type') and it.socket_type:
-                            kv.append((f"{name}::Socket Type", f"{it.socket_type}"))
+                        for attr, label, mode, need_truthy in _META_SPEC_KV:
+                            v = _getattr(it, attr, _MISSING)
+                            if v is _MISSING or (need_truthy and not v):
+                                continue
+                            if mode == "flag":
+                                kv.append((f"{name}::{label}", "True"))
+                            elif mode == "angle":
+                                kv.append((f"{name}::{label}", f"<{v}>"))
+                            else:
+                                kv.append((f"{name}::{label}", f"{v}"))
                     # fall through to writing the KV block below
             except Exception:
                 pass
 
             # 1) Unlinked INPUT socket defaults
-            in_names, _ = _display_names_for_sockets(n.inputs, True)
+            in_names = _display_names_for_sockets(n.inputs, True)
             for s, disp in zip(n.inputs, in_names):
                 if s.is_linked:
                     continue
@@ -1279,20 +1442,19 @@ class _TreeExport:
                     kv.append((disp, sv))
 
             # 2) OUTPUT socket defaults (e.g. 'Value' on a Value node)
-            out_names, _ = _display_names_for_sockets(n.outputs, False)
+            out_names = _display_names_for_sockets(n.outputs, False)
             for s, disp in zip(n.outputs, out_names):
-                if not hasattr(s, "default_value"):
+                if not _hasattr(s, "default_value"):
                     continue
                 sv = serialize_default(s)
                 if _is_meaningful_serialized_default(sv):
                     kv.append((disp, sv))
 
             # 3) Node RNA props (enums/toggles/number props you already collect)
-            kv.extend(collect_node_props(n))
+            kv.extend(collect_node_props(n, enum[n][2]))
 
             if kv:
-                typ, nid = enum[n]
-                out.append(f"Set  [ {typ} #{nid} ]:")
+                out.append(set_hdr_of[n])
                 for k, v in kv:
                     out.append(f"§ {k} § to {v}")
 
@@ -1303,44 +1465,47 @@ class _TreeExport:
             for _gi_id, _label, _rr_id in gi_placeholder_links:
                 out.append(f"Connect  [ Group Input #{_gi_id} ] ○ {_label}  to  [ Reroute #{_rr_id} ] ⦿ Input")
 
-        # Links (reroute-collapsed)
-        for fr, to in iter_links_collapsed(self.nt):
+        # Links (reroute-collapsed) — display names computed once per node,
+        # not once per link endpoint
+        dn_in = {n: _display_names_for_sockets(n.inputs, True) for n in enum}
+        dn_out = {n: _display_names_for_sockets(n.outputs, False) for n in enum}
+        ns_get = node_str_of.get
+        for fr, to in self._iter_links_collapsed(self.nt):
             nf, nt = fr.node, to.node
-            if nf not in enum or nt not in enum:
+            # Single .get doubles as membership test and lookup (enum,
+            # node_str_of and the dn_* dicts share the same key set)
+            nsf = ns_get(nf)
+            if nsf is None:
+                continue
+            nst = ns_get(nt)
+            if nst is None:
                 continue
-            tf, idf = enum[nf]
-            tt, idt = enum[nt]
             dotted = "Connect⋯" if link_is_field(fr, to) else "Connect"
-            in_names, _ = _display_names_for_sockets(nt.inputs, True)
-            out_names, _= _display_names_for_sockets(nf.outputs, False)
-            fi = socket_position(fr)
-            ti = socket_position(to)
+            in_names = dn_in[nt]
+            out_names = dn_out[nf]
+            fi = self._socket_position(fr)
+            ti = self._socket_position(to)
             onm = out_names[fi] if 0 <= fi < len(out_names) else (fr.name or "output")
             inm = in_names[ti]  if 0 <= ti < len(in_names)  else (to.name or "input")
-            out.append(f"{dotted}  [ {tf} #{idf} ] ○ {onm}  to  [ {tt} #{idt} ] ⦿ {inm}")
+            out.append(f"{dotted}  {nsf} ○ {onm}  to  {nst} ⦿ {inm}")
 
         # PairZone (Simulation / Repeat)
         self._emit_zone_pairs(self.nt, enum, out)
-        self.lines_top.extend(out)
 
         # Ensure any nested group blocks are exported
         for n in nodes:
-            if n.bl_idname == "GeometryNodeGroup" and n.node_tree:
+            if enum[n][2] == "GeometryNodeGroup" and n.node_tree:
                 self._export_group_block(n.node_tree)
 
     def _emit_zone_pairs(self, ng, enum, out):
-        sims_in  = []
-        sims_out = []
-        reps_in  = []
-        reps_out = []
-        for n in ng.nodes:
-            if is_reroute(n) or is_frame(n) or n not in enum:
-                continue
-            t, i = enum.get(n, (None, None))
-            if n.bl_idname == "GeometryNodeSimulationInput":  sims_in.append((n, i))
-            if n.bl_idname == "GeometryNodeSimulationOutput": sims_out.append((n, i))
-            if n.bl_idname == "GeometryNodeRepeatInput":      reps_in.append((n, i))
-            if n.bl_idname == "GeometryNodeRepeatOutput":     reps_out.append((n, i))
+        # One hash lookup classifies each node; non-zone nodes skip everything
+        buckets = ([], [], [], [])
+        sims_in, sims_out, reps_in, reps_out = buckets
+        bucket_of = _ZONE_BUCKETS.get
+        for n, (t, i, bl_id, _label, _variant) in enum.items():
+            b = bucket_of(bl_id)
+            if b is not None:
+                buckets[b].append((n, i))
         def by_x(a): return a[0].location[0]
         sims_in.sort(key=by_x); sims_out.sort(key=by_x)
         reps_in.sort(key=by_x); reps_out.sort(key=by_x)
@@ -1350,10 +1515,14 @@ class _TreeExport:
             out.append(f"PairZone  [ Repeat Input #{idi} ] <-> [ Repeat Output #{ido} ]")
 
     def run(self):
-        self.lines_groups = [f"# BNDL v{BNDL_VERSION}", "# === GROUP DEFINITIONS ==="]
-        self.lines_top = ["# === TOP LEVEL ==="]
+        self.lines_groups = _LineBuffer()
+        self.lines_groups.extend((f"# BNDL v{BNDL_VERSION}", "# === GROUP DEFINITIONS ==="))
+        self.lines_top = _LineBuffer()
+        self.lines_top.append("# === TOP LEVEL ===")
         self._export_top()
-        return "\n".join(self.lines_groups + [""] + self.lines_top) + "\n"
+        # Each buffer already ends every line with "\n"; the bare "\n" keeps the
+        # blank separator line the old list join produced.
+        return self.lines_groups.getvalue() + "\n" + self.lines_top.getvalue()
 
 # ---------- Runner ----------
 
@@ -1380,7 +1549,10 @@ def export_active_geonodes_to_bndl_text():
     text = exp.run()
     # Append SetUser block (modifier overrides vs. GI defaults), if any
     try:
-        text += _emit_setuser_block(nt, mod, text)
+        setuser_lines = []
+        _emit_setuser_block(nt, mod, text, setuser_lines)
+        if setuser_lines:
+            text += "\n".join(setuser_lines)
     except Exception as _ex:
         print(f"[BNDL] WARN: SetUser generation failed: {_ex}")
 